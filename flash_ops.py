@@ -1,5 +1,5 @@
 # flash_ops.py
-import os, subprocess, tempfile
+import os, subprocess, tempfile, hashlib, shutil
 from pathlib import Path
 from typing import Optional
 
@@ -7,6 +7,7 @@ from PyQt6.QtCore import QThread, pyqtSignal
 
 HDZERO_MAX = 64 * 1024
 FLASH_SIZE_BYTES = 1024 * 1024  # 1 MiB (W25Q80)
+IDENTIFY_BYTES = 4 * 1024       # cabecera leída para identificar el firmware
 
 FLASHROM_PATHS = [
     "/opt/homebrew/bin/flashrom",
@@ -44,6 +45,15 @@ def make_padded_image_1mib(fw_path: str) -> str:
         out.write(data)
     return tmp_path
 
+def header_signature(data: bytes) -> str:
+    # Las imágenes se flashean rellenas con 0xFF, así que un .bin más corto que la
+    # cabecera se compara igual que como queda en el chip.
+    head = data[:IDENTIFY_BYTES].ljust(IDENTIFY_BYTES, b"\xFF")
+    return hashlib.sha256(head).hexdigest()
+
+def is_blank_header(data: bytes) -> bool:
+    return data[:IDENTIFY_BYTES] == b"\xFF" * IDENTIFY_BYTES
+
 class FlashWorker(QThread):
     progress = pyqtSignal(int)
     status   = pyqtSignal(str)
@@ -108,3 +118,38 @@ class BackupWorker(QThread):
             self.ok.emit(self.out)
         except Exception as e:
             self.fail.emit(str(e))
+
+class IdentifyWorker(QThread):
+    log  = pyqtSignal(str)
+    ok   = pyqtSignal(bytes)
+    fail = pyqtSignal(str)
+
+    def __init__(self, flashrom_path: str):
+        super().__init__()
+        self.flashrom = flashrom_path
+
+    def run(self):
+        tmp_dir = tempfile.mkdtemp(prefix="hdzero_id_")
+        try:
+            from flash_ops import run_admin
+            # Lee solo la región de cabecera (layout de flashrom), no el chip completo
+            layout = os.path.join(tmp_dir, "layout.txt")
+            out = os.path.join(tmp_dir, "header.bin")
+            with open(layout, "w") as f:
+                f.write(f"00000000:{IDENTIFY_BYTES - 1:08x} header\n")
+            cmd = f'{self.flashrom} -p ch341a_spi -l "{layout}" -i header -r "{out}"'
+            self.log.emit(f"→ {cmd}\n")
+            r = run_admin(cmd)
+            self.log.emit(r.stdout)
+            if r.returncode != 0:
+                self.log.emit(r.stderr)
+                raise RuntimeError("Identify failed")
+            with open(out, "rb") as f:
+                header = f.read(IDENTIFY_BYTES)
+            if len(header) < IDENTIFY_BYTES:
+                raise RuntimeError("Short read from chip.")
+            self.ok.emit(header)
+        except Exception as e:
+            self.fail.emit(str(e))
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
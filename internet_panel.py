@@ -1,7 +1,20 @@
 # internet_panel.py
-import os, tempfile, requests
+import os, json, tempfile, asyncio, threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Dict, Callable
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+    import requests, requests.adapters
+try:
+    import h2  # noqa: F401  (habilita HTTP/2 en httpx)
+    HTTP2 = True
+except ImportError:
+    HTTP2 = False
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
@@ -9,7 +22,9 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtGui import QPixmap, QIcon, QTextCursor
 from PyQt6 import QtCore
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
+from PyQt6.QtCore import Qt, QObject, pyqtSignal
+
+from flash_ops import header_signature, is_blank_header, IDENTIFY_BYTES
 
 API_BASE = os.environ.get("HDZERO_API_BASE", "https://hdzero.go-next.co").rstrip("/")
 
@@ -17,68 +32,388 @@ def resource_path(relpath: str) -> str:
     base = getattr(__import__('sys').modules['__main__'], "_MEIPASS", Path(__file__).parent)
     return str(Path(base) / relpath)
 
-# Workers HTTP locales al panel Internet
-class LoadDevicesWorker(QThread):
-    ok = pyqtSignal(list); fail = pyqtSignal(str)
-    def run(self):
-        try:
-            url = f"{API_BASE}/api/devices"
-            r = requests.get(url, timeout=15)
-            r.raise_for_status()
-            self.ok.emit(r.json().get("devices", []))
-        except Exception as e:
-            self.fail.emit(str(e))
+# Núcleo HTTP: un único event loop asyncio en un hilo de fondo, con un cliente
+# keep-alive compartido (HTTP/2 si httpx+h2 están disponibles), concurrencia
+# acotada y coalescing de requests idénticos en vuelo.
+class NetReply(QObject):
+    progress = pyqtSignal(int); ok = pyqtSignal(object); fail = pyqtSignal(str)
 
-class LoadFirmwaresWorker(QThread):
-    ok = pyqtSignal(list); fail = pyqtSignal(str)
-    def __init__(self, device_id: int):
+    def __init__(self, core: "NetCore", key: tuple, timeout: float,
+                 extract: Optional[Callable] = None, background: bool = False):
         super().__init__()
-        self.device_id = device_id
-    def run(self):
-        try:
-            url = f"{API_BASE}/api/firmwares/{self.device_id}"
-            r = requests.get(url, timeout=15)
-            r.raise_for_status()
-            self.ok.emit(r.json().get("firmwares", []))
-        except Exception as e:
-            self.fail.emit(str(e))
+        # La prioridad forma parte de la clave: un request normal nunca se
+        # coalesce con uno de baja prioridad que espera turno.
+        self._core, self._key, self._timeout = core, key + (background,), timeout
+        self.extract = extract
+
+    def start(self) -> "NetReply":
+        # Conectar ok/fail/progress antes de llamar a start(), así no se pierde
+        # una respuesta (o un error) inmediata.
+        self._core._live[id(self)] = self
+        self._core._loop.call_soon_threadsafe(self._core._attach, self._key, self._timeout, self)
+        return self
+
+def json_field(name: str) -> Callable:
+    """Extractor para get_json: devuelve body[name] o falla si el body no es un objeto."""
+    def extract(body):
+        if not isinstance(body, dict):
+            raise ValueError(f"Unexpected API response (expected object with '{name}')")
+        return body.get(name) or []
+    return extract
+
+class NetCore(QObject):
+    _released = pyqtSignal(list)   # ids de NetReply ya entregados (hacia el hilo de Qt)
+
+    MAX_CONCURRENCY = 4
+    BACKGROUND_CONCURRENCY = 3   # slots que pueden ocupar los requests de baja prioridad
+    CHUNK = 8192
 
-class DownloadFirmwareWorker(QThread):
-    progress = pyqtSignal(int); ok = pyqtSignal(str); fail = pyqtSignal(str)
-    def __init__(self, url: str):
+    def __init__(self):
         super().__init__()
-        self.url = url
-    def run(self):
+        self._loop = asyncio.new_event_loop()
+        self._inflight: Dict[tuple, List[NetReply]] = {}
+        # Los NetReply son QObjects del hilo de Qt: se mantienen vivos aquí hasta
+        # que ok/fail se entregó, y la última referencia se suelta en el hilo de Qt.
+        self._live: Dict[int, NetReply] = {}
+        self._released.connect(self._on_released)
+        self._init_error: Optional[BaseException] = None
+        self._ready = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="hdzero-net", daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        if self._init_error is not None:
+            raise RuntimeError(f"Network core failed to start: {self._init_error}") from self._init_error
+
+    def _run(self):
+        try:
+            asyncio.set_event_loop(self._loop)
+            self._sem = asyncio.Semaphore(self.MAX_CONCURRENCY)
+            self._bg_sem = asyncio.Semaphore(self.BACKGROUND_CONCURRENCY)
+            if httpx is not None:
+                self._client = httpx.AsyncClient(
+                    http2=HTTP2, follow_redirects=True,
+                    limits=httpx.Limits(max_connections=self.MAX_CONCURRENCY,
+                                        max_keepalive_connections=self.MAX_CONCURRENCY),
+                )
+            else:
+                # Fallback: Session de requests (pool keep-alive) en un pool de hilos fijo
+                self._client = requests.Session()
+                adapter = requests.adapters.HTTPAdapter(pool_connections=self.MAX_CONCURRENCY,
+                                                        pool_maxsize=self.MAX_CONCURRENCY)
+                self._client.mount("http://", adapter)
+                self._client.mount("https://", adapter)
+                self._pool = ThreadPoolExecutor(max_workers=self.MAX_CONCURRENCY, thread_name_prefix="hdzero-http")
+        except BaseException as e:
+            self._init_error = e
+            return
+        finally:
+            self._ready.set()
+        self._loop.run_forever()
+
+    def _on_released(self, ids: list):
+        # Corre en el hilo de Qt, después de los ok/fail encolados para esos replies
+        for rid in ids:
+            self._live.pop(rid, None)
+
+    # ===== API pública (llamar desde el hilo de Qt; devuelven un NetReply sin arrancar) =====
+    def get_json(self, url: str, extract: Optional[Callable] = None, timeout: float = 15,
+                 background: bool = False) -> NetReply:
+        return NetReply(self, ("json", url, (), 0), timeout, extract, background)
+
+    def get_bytes(self, url: str, timeout: float = 10) -> NetReply:
+        return NetReply(self, ("bytes", url, (), 0), timeout)
+
+    def download(self, url: str, timeout: float = 30) -> NetReply:
+        return NetReply(self, ("file", url, (), 0), timeout)
+
+    def get_head(self, url: str, nbytes: int, validator: Optional[dict] = None,
+                 timeout: float = 15, background: bool = True) -> NetReply:
+        """Primeros nbytes de url (Range; si el servidor lo ignora se corta el body).
+        Con validator (etag/last_modified) el request es condicional y puede volver 304.
+        ok emite {"status", "content", "validator"}."""
+        headers = [("Range", f"bytes=0-{nbytes - 1}")]
+        if validator and validator.get("etag"):
+            headers.append(("If-None-Match", validator["etag"]))
+        elif validator and validator.get("last_modified"):
+            headers.append(("If-Modified-Since", validator["last_modified"]))
+        return NetReply(self, ("head", url, tuple(headers), nbytes), timeout, background=background)
+
+    def close(self):
+        async def _shutdown():
+            if httpx is not None:
+                await self._client.aclose()
+            else:
+                self._client.close()
+                self._pool.shutdown(wait=False)
+            self._loop.stop()
+        if self._loop.is_running():
+            asyncio.run_coroutine_threadsafe(_shutdown(), self._loop)
+
+    # ===== Internos (corren en el hilo del loop) =====
+    def _attach(self, key: tuple, timeout: float, reply: NetReply):
+        waiters = self._inflight.get(key)
+        if waiters is not None:
+            waiters.append(reply)   # mismo request ya en vuelo: comparte respuesta
+            return
+        self._inflight[key] = [reply]
+        self._loop.create_task(self._serve(key, timeout))
+
+    def _emit_progress(self, key: tuple, p: int):
+        for r in self._inflight.get(key, ()):
+            r.progress.emit(p)
+
+    async def _serve(self, key: tuple, timeout: float):
+        kind, url, headers, limit, background = key
+        try:
+            # Baja prioridad: nunca ocupa más de BACKGROUND_CONCURRENCY slots
+            async with (self._bg_sem if background else nullcontext()), self._sem:
+                if httpx is not None:
+                    result = await self._fetch_httpx(kind, url, dict(headers), limit, timeout,
+                                                     lambda p: self._emit_progress(key, p))
+                else:
+                    # El fetch corre en el executor: el progreso vuelve al loop
+                    progress = lambda p: self._loop.call_soon_threadsafe(self._emit_progress, key, p)
+                    result = await self._loop.run_in_executor(
+                        self._pool, self._fetch_requests, kind, url, dict(headers), limit, timeout, progress)
+        except Exception as e:
+            msg = str(e)
+            ids = self._complete(key, lambda r: r.fail.emit(msg))
+        else:
+            ids = self._complete(key, lambda r: self._deliver(r, result))
+        # Sin referencias a los replies en este hilo: el hilo de Qt suelta la última
+        self._released.emit(ids)
+
+    def _complete(self, key: tuple, deliver: Callable) -> list:
+        waiters = self._inflight.pop(key, [])
+        for r in waiters:
+            deliver(r)
+        return [id(r) for r in waiters]
+
+    @staticmethod
+    def _deliver(r: NetReply, result):
         try:
-            r = requests.get(self.url, stream=True, timeout=30)
+            value = r.extract(result) if r.extract else result
+        except Exception as e:
+            r.fail.emit(str(e))
+            return
+        r.ok.emit(value)
+
+    async def _fetch_httpx(self, kind: str, url: str, headers: dict, limit: int, timeout: float, progress):
+        if kind == "head":
+            async with self._client.stream("GET", url, headers=headers, timeout=timeout) as r:
+                if r.status_code == 304:
+                    return {"status": 304, "content": b"", "validator": None}
+                r.raise_for_status()
+                content = b""
+                async for chunk in r.aiter_bytes(self.CHUNK):
+                    content += chunk
+                    if len(content) >= limit:
+                        break   # servidor sin soporte de Range: no bajar el resto
+                return {"status": r.status_code, "content": content[:limit], "validator": _validator(r)}
+        if kind != "file":
+            r = await self._client.get(url, timeout=timeout)
+            r.raise_for_status()
+            return r.json() if kind == "json" else r.content
+        async with self._client.stream("GET", url, timeout=timeout) as r:
             r.raise_for_status()
             total = int(r.headers.get("Content-Length") or 0)
-            tmp = tempfile.NamedTemporaryFile(prefix="hdzero_dl_", suffix=".bin", delete=False)
-            tmp_path = tmp.name
-            tmp.close()
-            read = 0
-            with open(tmp_path, "wb") as f:
-                for chunk in r.iter_content(chunk_size=8192):
+            with _download_target() as (f, tmp_path):
+                read = 0
+                async for chunk in r.aiter_bytes(self.CHUNK):
+                    f.write(chunk)
+                    read += len(chunk)
+                    if total > 0:
+                        progress(int(read * 100 / total))
+        progress(100)
+        return tmp_path
+
+    def _fetch_requests(self, kind: str, url: str, headers: dict, limit: int, timeout: float, progress):
+        if kind == "head":
+            with self._client.get(url, headers=headers, stream=True, timeout=timeout) as r:
+                if r.status_code == 304:
+                    return {"status": 304, "content": b"", "validator": None}
+                r.raise_for_status()
+                content = b""
+                for chunk in r.iter_content(chunk_size=self.CHUNK):
+                    content += chunk
+                    if len(content) >= limit:
+                        break   # servidor sin soporte de Range: no bajar el resto
+                return {"status": r.status_code, "content": content[:limit], "validator": _validator(r)}
+        if kind != "file":
+            r = self._client.get(url, timeout=timeout)
+            r.raise_for_status()
+            return r.json() if kind == "json" else r.content
+        with self._client.get(url, stream=True, timeout=timeout) as r:
+            r.raise_for_status()
+            total = int(r.headers.get("Content-Length") or 0)
+            with _download_target() as (f, tmp_path):
+                read = 0
+                for chunk in r.iter_content(chunk_size=self.CHUNK):
                     if not chunk:
                         continue
                     f.write(chunk)
                     read += len(chunk)
                     if total > 0:
-                        self.progress.emit(int(read * 100 / total))
-            self.progress.emit(100)
-            self.ok.emit(tmp_path)
-        except Exception as e:
-            self.fail.emit(str(e))
+                        progress(int(read * 100 / total))
+        progress(100)
+        return tmp_path
+
+def _validator(r) -> dict:
+    return {"etag": r.headers.get("ETag"), "last_modified": r.headers.get("Last-Modified")}
+
+@contextmanager
+def _download_target():
+    tmp = tempfile.NamedTemporaryFile(prefix="hdzero_dl_", suffix=".bin", delete=False)
+    tmp_path = tmp.name
+    tmp.close()
+    with open(tmp_path, "wb") as f:
+        yield f, tmp_path
+
+_net_core: Optional[NetCore] = None
+
+def net_core() -> NetCore:
+    global _net_core
+    if _net_core is None:
+        _net_core = NetCore()
+    return _net_core
+
+# Índice de firmas: hash de la cabecera de cada .bin del catálogo -> (device, versión).
+# La caché en disco guarda por firmware_url la firma, su validador (ETag/Last-Modified)
+# y los devices/versiones que la usan, así Identify responde al instante desde la caché.
+# Al cargar la lista de devices se revalida en segundo plano, pidiendo solo los primeros
+# IDENTIFY_BYTES de cada .bin con requests condicionales de baja prioridad.
+class SignatureIndex(QObject):
+    ready = pyqtSignal()
+    CACHE_PATH = os.path.expanduser("~/.hdzero_signatures.json")
+
+    def __init__(self):
+        super().__init__()
+        self._cache: Dict[str, dict] = self._load_cache()
+        self.entries: Dict[str, List[dict]] = self._index(self._cache)
+        self.is_building = False
+        self.has_built = False   # ya revalidado contra el catálogo en esta sesión
+        self.failures = 0
+        self._fresh: Dict[str, dict] = {}
+        self._generation = 0
+        self._pending = 0
+
+    def _load_cache(self) -> Dict[str, dict]:
+        try:
+            with open(self.CACHE_PATH, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception:
+            return {}
+        if not isinstance(data, dict):
+            return {}
+        return {url: e for url, e in data.items()
+                if isinstance(e, dict) and e.get("sig") and isinstance(e.get("owners"), list)}
+
+    def _save_cache(self):
+        try:
+            with open(self.CACHE_PATH, "w", encoding="utf-8") as f:
+                json.dump(self._cache, f)
+        except Exception:
+            pass
+
+    @staticmethod
+    def _index(cache: Dict[str, dict]) -> Dict[str, List[dict]]:
+        entries: Dict[str, List[dict]] = {}
+        for e in cache.values():
+            for o in e["owners"]:
+                device = {"device_id": o.get("device_id"), "device_name": o.get("device_name")}
+                entries.setdefault(e["sig"], []).append({"device": device, "version": o.get("version")})
+        return entries
+
+    def build(self, devices: List[dict]):
+        self._generation += 1
+        gen = self._generation
+        self.failures = 0
+        self._fresh = {}
+        self.is_building = True
+        self._pending = len(devices)
+        for d in devices:
+            w = net_core().get_json(f"{API_BASE}/api/firmwares/{d.get('device_id')}",
+                                    json_field("firmwares"), background=True)
+            w.ok.connect(lambda fws, d=d, g=gen: self._on_firmwares(g, d, fws))
+            w.fail.connect(lambda _msg, g=gen: self._done(g, failed=True))
+            w.start()
+        if not devices:
+            self._finish()
+
+    def lookup(self, header: bytes) -> List[dict]:
+        return self.entries.get(header_signature(header), [])
+
+    def _on_firmwares(self, gen: int, device: dict, firmwares: list):
+        if gen != self._generation:
+            return
+        for fw in firmwares:
+            url = fw.get("firmware_url") if isinstance(fw, dict) else None
+            if not url:
+                continue
+            owner = {"device_id": device.get("device_id"), "device_name": device.get("device_name"),
+                     "version": fw.get("version")}
+            self._pending += 1
+            w = net_core().get_head(url, IDENTIFY_BYTES, self._cache.get(url))
+            w.ok.connect(lambda res, url=url, o=owner, g=gen: self._on_head(g, url, o, res))
+            w.fail.connect(lambda _msg, g=gen: self._done(g, failed=True))
+            w.start()
+        self._done(gen)
+
+    def _on_head(self, gen: int, url: str, owner: dict, res: dict):
+        if gen != self._generation:
+            return
+        cached = self._cache.get(url)
+        if res["status"] == 304:
+            if not cached:
+                self._done(gen, failed=True)
+                return
+            sig = cached["sig"]
+            validator = {"etag": cached.get("etag"), "last_modified": cached.get("last_modified")}
+        else:
+            sig = header_signature(res["content"])
+            validator = res["validator"] or {}
+        entry = self._fresh.setdefault(url, dict(validator, sig=sig, owners=[]))
+        entry["owners"].append(owner)
+        self._done(gen)
+
+    def _done(self, gen: int, failed: bool = False):
+        if gen != self._generation:
+            return
+        if failed:
+            self.failures += 1
+        self._pending -= 1
+        if self._pending <= 0:
+            self._finish()
+
+    def _finish(self):
+        # Con fallos se conserva lo cacheado para las URLs que no se pudieron revalidar;
+        # con el catálogo completo, las URLs que ya no existen desaparecen.
+        if self.failures:
+            self._cache = dict(self._cache, **self._fresh)
+        else:
+            self._cache = self._fresh
+        self._fresh = {}
+        self.entries = self._index(self._cache)
+        self.is_building = False
+        self.has_built = True
+        self._save_cache()
+        self.ready.emit()
 
 class InternetPanel(QWidget):
     firmwareSelected = pyqtSignal(str)   # path local descargado (lo ve Local)
     log = pyqtSignal(str)                # logs hacia Local
     flashRequested = pyqtSignal(str)     # pide flashear un path local
+    identifyRequested = pyqtSignal()     # pide leer la cabecera del chip
 
     def __init__(self):
         super().__init__()
         self.devices: List[dict] = []
         self.firmwares: List[dict] = []
+        self._img_url: Optional[str] = None
+        self._pending_header: Optional[bytes] = None
+
+        self.sig_index = SignatureIndex()
+        self.sig_index.ready.connect(self.on_sig_index_ready)
 
         root = QVBoxLayout(self)
         root.setContentsMargins(10,10,10,10)
@@ -104,9 +439,22 @@ class InternetPanel(QWidget):
             btn_reload.setIconSize(QtCore.QSize(15, 15))
         btn_reload.clicked.connect(self.load_devices)
 
+        self.btn_identify = QPushButton(" Identify")
+        self.btn_identify.setToolTip("Read the chip header and auto-select the connected VTX")
+        self.btn_identify.clicked.connect(self.identifyRequested.emit)
+
+        btn_row = QHBoxLayout()
+        btn_row.addWidget(btn_reload)
+        btn_row.addWidget(self.btn_identify)
+
         left_col.addWidget(lbl_dev, 0, Qt.AlignmentFlag.AlignTop)
         left_col.addWidget(self.cb_devices)
-        left_col.addWidget(btn_reload)
+        left_col.addLayout(btn_row)
+
+        # Resultado de Identify: lo que hay en el chip (no cambia el firmware a flashear)
+        self.lbl_installed = QLabel("")
+        self.lbl_installed.setStyleSheet("color:#bbbbbb;")
+        left_col.addWidget(self.lbl_installed)
 
         self.device_img = QLabel("No image")
         self.device_img.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -194,11 +542,10 @@ class InternetPanel(QWidget):
     def load_devices(self):
         self.set_loading("Loading devices…")
         self.cb_devices.clear()
-        w = LoadDevicesWorker()
+        w = net_core().get_json(f"{API_BASE}/api/devices", json_field("devices"))
         w.ok.connect(self.on_devices_ok)
-        w.fail.connect(self.on_fail)
-        w.start()
-        self._w_dev = w
+        w.fail.connect(self.on_devices_fail)
+        self._w_dev = w.start()
 
     def on_devices_ok(self, devices: list):
         self.devices = devices or []
@@ -207,28 +554,46 @@ class InternetPanel(QWidget):
             name = d.get("device_name") or f"Device {d.get('device_id')}"
             self.cb_devices.addItem(name, d)
         self.set_loading(f"{len(self.devices)} device(s) loaded")
+        self.sig_index.build(self.devices)   # revalida la caché de firmas en segundo plano
         if self.devices:
             self.cb_devices.setCurrentIndex(0)
             self.on_device_changed()
 
+    def on_devices_fail(self, msg: str):
+        self.on_fail(msg)
+        if self._pending_header is not None:
+            self._pending_header = None
+            self.status_append("Identify: device list unavailable; cannot build signature index.")
+
     def _set_device_image(self, url: Optional[str]):
+        self._img_url = url
+        self.device_img.setPixmap(QPixmap())
         if not url:
             self.device_img.setText("No image")
-            self.device_img.setPixmap(QPixmap())
             return
+        self.device_img.setText("Loading…")
+        w = net_core().get_bytes(url)
+        w.ok.connect(lambda content: self._on_image_ok(url, content))
+        w.fail.connect(lambda _msg: self._on_image_fail(url))
+        self._w_img = w.start()
+
+    def _on_image_ok(self, url: str, content: bytes):
+        if url != self._img_url:
+            return   # respuesta de un device anterior
         pix = QPixmap()
-        try:
-            r = requests.get(url, timeout=10)
-            r.raise_for_status()
-            pix.loadFromData(r.content)
-        except Exception:
-            self.device_img.setText("Image load error")
-            self.device_img.setPixmap(QPixmap())
+        if not pix.loadFromData(content):
+            self._on_image_fail(url)
             return
         scaled = pix.scaled(300, 220, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
         self.device_img.setPixmap(scaled)
         self.device_img.setText("")
 
+    def _on_image_fail(self, url: str):
+        if url != self._img_url:
+            return
+        self.device_img.setText("Image load error")
+        self.device_img.setPixmap(QPixmap())
+
     def on_device_changed(self):
         data = self.cb_devices.currentData()
         if not data:
@@ -240,11 +605,16 @@ class InternetPanel(QWidget):
         device_id = data.get("device_id")
         self.set_loading("Loading firmwares…")
         self.cb_fw.clear()
-        w = LoadFirmwaresWorker(device_id)
-        w.ok.connect(self.on_fw_ok)
+        w = net_core().get_json(f"{API_BASE}/api/firmwares/{device_id}", json_field("firmwares"))
+        w.ok.connect(lambda fws: self._on_fw_reply(device_id, fws))
         w.fail.connect(self.on_fail)
-        w.start()
-        self._w_fw = w
+        self._w_fw = w.start()
+
+    def _on_fw_reply(self, device_id, firmwares: list):
+        data = self.cb_devices.currentData()
+        if not data or data.get("device_id") != device_id:
+            return   # respuesta de un device anterior
+        self.on_fw_ok(firmwares)
 
     def on_fw_ok(self, firmwares: list):
         self.firmwares = firmwares or []
@@ -261,6 +631,70 @@ class InternetPanel(QWidget):
         fw = self.cb_fw.currentData()
         self.notes.setPlainText("" if not fw else (fw.get("notes") or ""))
 
+    # ===== Identificar chip conectado =====
+    def ensure_sig_index(self):
+        # Llamado cuando la lectura del chip ya arrancó: reintenta la revalidación
+        # si no corrió o quedó incompleta (la caché responde mientras tanto).
+        if self.sig_index.is_building:
+            return
+        if not self.devices:
+            self.status_append("Device list not loaded; reloading…")
+            self.load_devices()
+            return
+        if self.sig_index.failures or not self.sig_index.has_built:
+            self.sig_index.build(self.devices)
+
+    def identify_from_header(self, header: bytes):
+        self._pending_header = None
+        self.lbl_installed.setText("")
+        if is_blank_header(header):
+            self.set_loading("Chip is blank")
+            self.status_append("Identify: chip is blank (erased).")
+            return
+        matches = self.sig_index.lookup(header)
+        if not matches and self.sig_index.is_building:
+            # Puede ser un firmware nuevo del catálogo: esperar a la revalidación
+            self._pending_header = header
+            self.set_loading("Refreshing signature index…")
+            self.status_append("Chip header not in cached index; waiting for catalog refresh…")
+            return
+        if not matches and (self.sig_index.failures or not self.sig_index.has_built):
+            self.set_loading("Unknown firmware (index incomplete)")
+            self.status_append("Identify: no match, but the signature index could not be fully "
+                               "checked against the catalog. Try Identify again.")
+            return
+        if not matches:
+            self.set_loading("Unknown firmware")
+            self.status_append("Identify: no catalog firmware matches the chip header.")
+            return
+
+        device_ids = {m["device"].get("device_id") for m in matches}
+        if len(device_ids) > 1:
+            names = sorted({m["device"].get("device_name") or str(m["device"].get("device_id")) for m in matches})
+            self.set_loading("Ambiguous match")
+            self.status_append(f"Identify: header matches several devices: {', '.join(names)}")
+            return
+
+        device = matches[0]["device"]
+        versions = [m["version"] for m in matches if m["version"]]
+        name = device.get("device_name") or f"Device {device.get('device_id')}"
+        installed = versions[0] if len(versions) == 1 else " / ".join(versions) or "unknown"
+        self.set_loading(f"Identified: {name}")
+        self.lbl_installed.setText(f"Installed on chip: {installed}")
+        self.status_append(f"Identify: {name} — installed firmware {installed}")
+        self.log.emit(f"[Internet] Identified {name}, installed firmware {installed}\n")
+
+        idx = next((i for i in range(self.cb_devices.count())
+                    if (self.cb_devices.itemData(i) or {}).get("device_id") == device.get("device_id")), -1)
+        if idx >= 0 and idx != self.cb_devices.currentIndex():
+            self.cb_devices.setCurrentIndex(idx)   # cb_fw queda en su default (la más nueva)
+
+    def on_sig_index_ready(self):
+        failed = f", {self.sig_index.failures} fetch(es) failed" if self.sig_index.failures else ""
+        self.log.emit(f"[Internet] Signature index ready ({len(self.sig_index.entries)} header(s){failed})\n")
+        if self._pending_header is not None:
+            self.identify_from_header(self._pending_header)
+
     # ===== Descargar y pedir flash =====
     def download_selected_fw(self):
         fw = self.cb_fw.currentData()
@@ -274,12 +708,11 @@ class InternetPanel(QWidget):
 
         self.set_phase("Wait - Downloading.")
         self.status_set(f"Downloading: {url}")
-        w = DownloadFirmwareWorker(url)
+        w = net_core().download(url)
         w.progress.connect(lambda p: self.set_loading(f"Downloading… {p}%"))
         w.ok.connect(self.on_download_ok_then_flash)
         w.fail.connect(self.on_fail)
-        w.start()
-        self._w_dl = w
+        self._w_dl = w.start()
 
     def on_download_ok_then_flash(self, local_path: str):
         self.firmwareSelected.emit(local_path)          
@@ -12,8 +12,8 @@ from PyQt6.QtGui import QPixmap, QIcon, QTextCursor
 from PyQt6 import QtCore
 from PyQt6.QtCore import Qt
 
-from internet_panel import InternetPanel, resource_path
-from flash_ops import find_flashrom, FlashWorker, BackupWorker, HDZERO_MAX
+from internet_panel import InternetPanel, resource_path, net_core
+from flash_ops import find_flashrom, FlashWorker, BackupWorker, IdentifyWorker, HDZERO_MAX
 
 APP_TITLE = "HDZero Programmer Tool – by Gunther_FPV"
 APP_HEADER_TITLE = "HDzero Programmer for MAC"
@@ -126,6 +126,7 @@ class MainWindow(QWidget):
 
         self.flashrom = find_flashrom() or ""
         self.fw_path: Optional[Path] = None
+        self.chip_busy = False   # un solo flashrom a la vez sobre el CH341A
 
         # Estilo oscuro + tabs gris
         self.setStyleSheet("""
@@ -175,6 +176,7 @@ class MainWindow(QWidget):
         self.panel_internet.firmwareSelected.connect(self.on_fw_downloaded_set_local)
         self.panel_internet.log.connect(self.panel_local.append_log)
         self.panel_internet.flashRequested.connect(self.start_flash)
+        self.panel_internet.identifyRequested.connect(self.start_identify)
 
         # Tabs con íconos
         icon_internet = QIcon(resource_path("internet.png")) if Path(resource_path("internet.png")).exists() else QIcon()
@@ -196,14 +198,27 @@ class MainWindow(QWidget):
         self.panel_local.set_fw_path(path)
         self.panel_local.append_log(f"Downloaded from Internet → {path}\n")
 
+    def set_chip_busy(self, busy: bool):
+        self.chip_busy = busy
+        for btn in (self.panel_local.flash_btn, self.panel_local.btn_backup,
+                    self.panel_internet.btn_flash, self.panel_internet.btn_identify):
+            btn.setEnabled(not busy)
+
+    def check_chip_idle(self) -> bool:
+        if self.chip_busy:
+            QMessageBox.warning(self, "Busy", "Another programmer operation is running. Wait for it to finish.")
+            return False
+        return True
+
     def start_backup(self):
+        if not self.check_chip_idle():
+            return
         if not self.flashrom or not os.path.exists(self.flashrom):
             QMessageBox.critical(self, "Error", "flashrom not found. Install: brew install flashrom")
             return
         ts = time.strftime("%Y%m%d-%H%M%S")
         out = os.path.expanduser(f"~/HDZero_backup_{ts}.bin")
-        self.panel_local.btn_backup.setEnabled(False)
-        self.panel_local.flash_btn.setEnabled(False)
+        self.set_chip_busy(True)
         self.panel_local.status.setText("Backing up…")
         self.panel_local.pb.setRange(0, 0)
 
@@ -219,8 +234,7 @@ class MainWindow(QWidget):
         self.panel_local.pb.setValue(100)
         self.panel_local.append_log(f"Backup saved: {out_path}\n")
         QMessageBox.information(self, "Backup", f"Backup saved at:\n{out_path}")
-        self.panel_local.btn_backup.setEnabled(True)
-        self.panel_local.flash_btn.setEnabled(True)
+        self.set_chip_busy(False)
 
     def on_backup_fail(self, msg: str):
         self.panel_local.status.setText("❌ Backup error")
@@ -228,10 +242,28 @@ class MainWindow(QWidget):
         self.panel_local.pb.setValue(100)
         self.panel_local.append_log(f"\nERROR: {msg}\n")
         QMessageBox.critical(self, "Error", msg)
-        self.panel_local.btn_backup.setEnabled(True)
-        self.panel_local.flash_btn.setEnabled(True)
+        self.set_chip_busy(False)
+
+    def start_identify(self):
+        if not self.check_chip_idle():
+            return
+        if not self.flashrom or not os.path.exists(self.flashrom):
+            QMessageBox.critical(self, "Error", "flashrom not found. Install: brew install flashrom")
+            return
+        self.set_chip_busy(True)
+        self.panel_internet.set_loading("Reading chip header…")
+
+        self.idw = IdentifyWorker(self.flashrom)
+        self.idw.log.connect(self.panel_local.append_log)
+        self.idw.ok.connect(self.panel_internet.identify_from_header)
+        self.idw.fail.connect(self.panel_internet.on_fail)
+        self.idw.finished.connect(lambda: self.set_chip_busy(False))
+        self.idw.start()
+        self.panel_internet.ensure_sig_index()
 
     def start_flash(self, fw_path: str):
+        if not self.check_chip_idle():
+            return
         if not fw_path or not Path(fw_path).exists():
             QMessageBox.critical(self, "Error", "Select a .bin file.")
             return
@@ -239,8 +271,7 @@ class MainWindow(QWidget):
             QMessageBox.critical(self, "Error", "flashrom not found. Install: brew install flashrom")
             return
 
-        self.panel_local.flash_btn.setEnabled(False)
-        self.panel_local.btn_backup.setEnabled(False)
+        self.set_chip_busy(True)
         self.panel_local.pb.setRange(0, 100)
         self.panel_local.pb.setValue(0)
         self.panel_local.status.setText("Flashing…")
@@ -265,8 +296,7 @@ class MainWindow(QWidget):
         self.panel_local.pb.setValue(100)
         self.panel_internet.status_append("Finished.")
         QMessageBox.information(self, "Success", "Flash completed and verified.")
-        self.panel_local.flash_btn.setEnabled(True)
-        self.panel_local.btn_backup.setEnabled(True)
+        self.set_chip_busy(False)
 
     def on_flash_fail(self, msg: str):
         self.panel_local.status.setText("❌ Error")
@@ -274,8 +304,7 @@ class MainWindow(QWidget):
         self.panel_internet.status_append(f"ERROR: {msg}")
         self.panel_local.append_log(f"\nERROR: {msg}\n")
         QMessageBox.critical(self, "Error", msg)
-        self.panel_local.flash_btn.setEnabled(True)
-        self.panel_local.btn_backup.setEnabled(True)
+        self.set_chip_busy(False)
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
@@ -283,5 +312,6 @@ if __name__ == "__main__":
     if Path(app_icon_path).exists():
         app.setWindowIcon(QIcon(app_icon_path))
     w = MainWindow()
+    app.aboutToQuit.connect(net_core().close)
     w.show()
     sys.exit(app.exec())